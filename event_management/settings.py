@@ -99,6 +99,10 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', 'root'),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Keep requests out of a wrapping transaction so read-only GETs
+        # don't pay for BEGIN/COMMIT; writes that need atomicity use
+        # transaction.atomic explicitly
+        'ATOMIC_REQUESTS': False,
         'OPTIONS': {
             'connect_timeout': 10,
         }
@@ -184,6 +188,16 @@ SIMPLE_JWT = {
 # Celery Configuration
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
+# Task kwargs are JSON-safe primitives, so msgpack gives smaller, faster
+# messages; JSON stays accepted for messages already queued
+CELERY_TASK_SERIALIZER = 'msgpack'
+CELERY_RESULT_SERIALIZER = 'msgpack'
+CELERY_ACCEPT_CONTENT = ['msgpack', 'json']
+# Notification emails get their own queue so large fan-outs don't delay
+# other tasks; run a dedicated worker with -Q emails --prefetch-multiplier=1
+CELERY_TASK_ROUTES = {
+    'events.tasks.send_*': {'queue': 'emails'},
+}
 
 
 # Cache Configuration (Redis)
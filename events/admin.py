@@ -8,7 +8,11 @@ Following best practices:
 - Inline editing for related models
 """
 from django.contrib import admin
+from django.forms.models import BaseInlineFormSet
+from django.urls import reverse
+from django.utils.html import format_html_join
 from .models import UserProfile, Event, RSVP, Review
+from .signals import notifications_suppressed
 
 
 @admin.register(UserProfile)
@@ -34,22 +38,43 @@ class UserProfileAdmin(admin.ModelAdmin):
     )
 
 
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset showing only the newest `max_rows` related rows, so
+    popular events don't render thousands of forms. This also bounds the
+    per-row user label lookups of the raw_id_fields widget. The full list
+    is linked from EventAdmin.related_changelists.
+    """
+
+    max_rows = 20
+
+    def get_queryset(self):
+        """Slice the event's rows after the FK filter and default ordering."""
+        if not hasattr(self, '_queryset'):
+            self._queryset = super().get_queryset()[:self.max_rows]
+        return self._queryset
+
+
 class RSVPInline(admin.TabularInline):
     """Inline admin for RSVPs within Event admin."""
     
     model = RSVP
+    formset = LimitedInlineFormSet
     extra = 0
     readonly_fields = ['created_at', 'updated_at']
     fields = ['user', 'status', 'created_at']
+    raw_id_fields = ['user']
 
 
 class ReviewInline(admin.TabularInline):
     """Inline admin for Reviews within Event admin."""
     
     model = Review
+    formset = LimitedInlineFormSet
     extra = 0
     readonly_fields = ['created_at', 'updated_at']
     fields = ['user', 'rating', 'comment', 'created_at']
+    raw_id_fields = ['user']
 
 
 @admin.register(Event)
@@ -60,9 +85,12 @@ class EventAdmin(admin.ModelAdmin):
         'title', 'organizer', 'location', 'start_time',
         'is_public', 'attendee_count', 'created_at'
     ]
+    list_select_related = ['organizer']
     search_fields = ['title', 'description', 'location', 'organizer__username']
     list_filter = ['is_public', 'start_time', 'created_at']
-    readonly_fields = ['created_at', 'updated_at', 'attendee_count']
+    readonly_fields = [
+        'created_at', 'updated_at', 'attendee_count', 'related_changelists'
+    ]
     date_hierarchy = 'start_time'
     inlines = [RSVPInline, ReviewInline]
     
@@ -77,7 +105,7 @@ class EventAdmin(admin.ModelAdmin):
             'fields': ('is_public',)
         }),
         ('Statistics', {
-            'fields': ('attendee_count',),
+            'fields': ('attendee_count', 'related_changelists'),
             'classes': ('collapse',)
         }),
         ('Timestamps', {
@@ -86,10 +114,34 @@ class EventAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        """Annotate attendee counts in one query instead of one per row."""
+        return super().get_queryset(request).with_counts()
+
+    def save_formset(self, request, form, formset, change):
+        """Save inline RSVPs and reviews without emailing the organizer per row."""
+        with notifications_suppressed():
+            super().save_formset(request, form, formset, change)
+
     def attendee_count(self, obj):
         """Display count of confirmed attendees."""
         return obj.attendee_count
     attendee_count.short_description = 'Attendees'
+    attendee_count.admin_order_field = 'attendee_count'
+
+    def related_changelists(self, obj):
+        """Link to every RSVP and review of the event; the inlines show the newest only."""
+        if obj is None or obj.pk is None:
+            return '-'
+        return format_html_join(
+            ' | ',
+            '<a href="{}?event__id__exact={}">See all {}</a>',
+            [
+                (reverse('admin:events_rsvp_changelist'), obj.pk, 'RSVPs'),
+                (reverse('admin:events_review_changelist'), obj.pk, 'reviews'),
+            ],
+        )
+    related_changelists.short_description = 'RSVPs & reviews'
 
 
 @admin.register(RSVP)
@@ -97,6 +149,7 @@ class RSVPAdmin(admin.ModelAdmin):
     """Admin interface for RSVP."""
     
     list_display = ['user', 'event', 'status', 'created_at']
+    list_select_related = ['user', 'event', 'event__organizer']
     search_fields = ['user__username', 'event__title']
     list_filter = ['status', 'created_at']
     readonly_fields = ['created_at', 'updated_at']
@@ -118,6 +171,7 @@ class ReviewAdmin(admin.ModelAdmin):
     """Admin interface for Review."""
     
     list_display = ['user', 'event', 'rating', 'created_at']
+    list_select_related = ['user', 'event', 'event__organizer']
     search_fields = ['user__username', 'event__title', 'comment']
     list_filter = ['rating', 'created_at']
     readonly_fields = ['created_at', 'updated_at']
@@ -0,0 +1,28 @@
+"""
+View decorators for Event Management System.
+"""
+from functools import wraps
+
+from django.views.decorators.cache import cache_page
+
+
+def cache_page_if_anonymous(timeout, **kwargs):
+    """
+    Like cache_page, but only for anonymous requests.
+
+    Authenticated users see results filtered to their own access (private
+    events they organize or RSVP'd to), and the page cache key doesn't vary
+    by user, so their responses must never be stored or served from it.
+    """
+    def decorator(view_func):
+        cached_view_func = cache_page(timeout, **kwargs)(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **view_kwargs):
+            if request.user.is_authenticated:
+                return view_func(request, *args, **view_kwargs)
+            return cached_view_func(request, *args, **view_kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,33 @@
+"""
+FilterSets for Event Management System.
+
+Declared once at import time; with `filterset_fields` on a viewset,
+DjangoFilterBackend builds a new FilterSet class on every request.
+"""
+import django_filters
+
+from .models import Event, RSVP, Review
+
+
+class EventFilterSet(django_filters.FilterSet):
+    """Filter events by visibility, organizer and location."""
+
+    class Meta:
+        model = Event
+        fields = ['is_public', 'organizer', 'location']
+
+
+class RSVPFilterSet(django_filters.FilterSet):
+    """Filter RSVPs by event and status."""
+
+    class Meta:
+        model = RSVP
+        fields = ['event', 'status']
+
+
+class ReviewFilterSet(django_filters.FilterSet):
+    """Filter reviews by event and rating."""
+
+    class Meta:
+        model = Review
+        fields = ['event', 'rating']
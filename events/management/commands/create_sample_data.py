@@ -3,7 +3,9 @@ Management command to create sample data for testing.
 Usage: python manage.py create_sample_data
 """
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from events.models import UserProfile, Event, RSVP, Review
@@ -12,38 +14,47 @@ from events.models import UserProfile, Event, RSVP, Review
 class Command(BaseCommand):
     help = 'Creates sample data for testing the Event Management System'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write(self.style.SUCCESS('Creating sample data...'))
 
         # Create users
-        users = []
-        for i in range(1, 6):
-            user, created = User.objects.get_or_create(
+        usernames = [f'user{i}' for i in range(1, 6)]
+        existing_usernames = set(
+            User.objects.filter(username__in=usernames).values_list('username', flat=True)
+        )
+        password = make_password('password123')
+        users_to_create = [
+            User(
                 username=f'user{i}',
-                defaults={
-                    'email': f'user{i}@yopmail.com',
-                    'first_name': f'User{i}',
-                    'last_name': 'Test'
-                }
+                email=f'user{i}@yopmail.com',
+                first_name=f'User{i}',
+                last_name='Test',
+                password=password
             )
-            if created:
-                user.set_password('password123')
-                user.save()
-                self.stdout.write(f'Created user: {user.username}')
-            
-            # Create user profile
-            profile, created = UserProfile.objects.get_or_create(
+            for i in range(1, 6)
+            if f'user{i}' not in existing_usernames
+        ]
+        User.objects.bulk_create(users_to_create, ignore_conflicts=True, batch_size=1000)
+        for user in users_to_create:
+            self.stdout.write(f'Created user: {user.username}')
+
+        users_by_username = User.objects.in_bulk(usernames, field_name='username')
+        users = [users_by_username[username] for username in usernames]
+
+        # Create user profiles
+        profiles_to_create = [
+            UserProfile(
                 user=user,
-                defaults={
-                    'full_name': f'User {i} Full Name',
-                    'bio': f'Bio for user {i}',
-                    'location': f'City {i}'
-                }
+                full_name=f'User {i} Full Name',
+                bio=f'Bio for user {i}',
+                location=f'City {i}'
             )
-            users.append(user)
+            for i, user in enumerate(users, start=1)
+        ]
+        UserProfile.objects.bulk_create(profiles_to_create, ignore_conflicts=True, batch_size=1000)
 
         # Create events
-        events = []
         now = timezone.now()
         
         event_data = [
@@ -84,64 +95,86 @@ class Command(BaseCommand):
             }
         ]
 
+        titles = [data['title'] for data in event_data]
+        existing_titles = set(
+            Event.objects.filter(title__in=titles).values_list('title', flat=True)
+        )
+        events_to_create = []
         for i, data in enumerate(event_data):
+            if data['title'] in existing_titles:
+                continue
             start_time = now + timedelta(days=data['days_ahead'])
-            end_time = start_time + timedelta(hours=3)
-            
-            event, created = Event.objects.get_or_create(
+            events_to_create.append(Event(
                 title=data['title'],
-                defaults={
-                    'description': data['description'],
-                    'organizer': users[i % len(users)],
-                    'location': data['location'],
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'is_public': data['is_public']
-                }
-            )
-            if created:
-                self.stdout.write(f'Created event: {event.title}')
-            events.append(event)
+                description=data['description'],
+                organizer=users[i % len(users)],
+                location=data['location'],
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=3),
+                is_public=data['is_public']
+            ))
+        Event.objects.bulk_create(events_to_create, batch_size=1000)
+        for event in events_to_create:
+            self.stdout.write(f'Created event: {event.title}')
+
+        events_by_title = {
+            event.title: event for event in Event.objects.filter(title__in=titles)
+        }
+        events = [events_by_title[title] for title in titles]
 
         # Create RSVPs
-        rsvp_count = 0
-        for event in events[:3]:  # First 3 events
-            for user in users[:3]:  # First 3 users
-                if event.organizer != user:
-                    rsvp, created = RSVP.objects.get_or_create(
-                        event=event,
-                        user=user,
-                        defaults={'status': 'going'}
-                    )
-                    if created:
-                        rsvp_count += 1
-
-        self.stdout.write(f'Created {rsvp_count} RSVPs')
+        existing_rsvps = set(
+            RSVP.objects.filter(event__in=events[:3], user__in=users[:3])
+            .values_list('event_id', 'user_id')
+        )
+        rsvps_to_create = [
+            RSVP(event=event, user=user, status='going')
+            for event in events[:3]  # First 3 events
+            for user in users[:3]  # First 3 users
+            if event.organizer_id != user.id
+            and (event.id, user.id) not in existing_rsvps
+        ]
+        RSVP.objects.bulk_create(rsvps_to_create, ignore_conflicts=True, batch_size=1000)
+
+        self.stdout.write(f'Created {len(rsvps_to_create)} RSVPs')
 
         # Create Reviews
-        review_count = 0
-        for event in events[:2]:  # First 2 events
-            for user in users[:2]:  # First 2 users
-                if event.organizer != user:
-                    # Make sure user has RSVP'd as 'going'
-                    RSVP.objects.get_or_create(
-                        event=event,
-                        user=user,
-                        defaults={'status': 'going'}
-                    )
-                    
-                    review, created = Review.objects.get_or_create(
-                        event=event,
-                        user=user,
-                        defaults={
-                            'rating': 5,
-                            'comment': f'Great event! Enjoyed it very much.'
-                        }
-                    )
-                    if created:
-                        review_count += 1
-
-        self.stdout.write(f'Created {review_count} reviews')
+        review_pairs = [
+            (event, user)
+            for event in events[:2]  # First 2 events
+            for user in users[:2]  # First 2 users
+            if event.organizer_id != user.id
+        ]
+
+        # Make sure reviewers have RSVP'd as 'going'
+        existing_rsvps.update((rsvp.event_id, rsvp.user_id) for rsvp in rsvps_to_create)
+        RSVP.objects.bulk_create(
+            [
+                RSVP(event=event, user=user, status='going')
+                for event, user in review_pairs
+                if (event.id, user.id) not in existing_rsvps
+            ],
+            ignore_conflicts=True,
+            batch_size=1000
+        )
+
+        existing_reviews = set(
+            Review.objects.filter(event__in=events[:2], user__in=users[:2])
+            .values_list('event_id', 'user_id')
+        )
+        reviews_to_create = [
+            Review(
+                event=event,
+                user=user,
+                rating=5,
+                comment='Great event! Enjoyed it very much.'
+            )
+            for event, user in review_pairs
+            if (event.id, user.id) not in existing_reviews
+        ]
+        Review.objects.bulk_create(reviews_to_create, ignore_conflicts=True, batch_size=1000)
+
+        self.stdout.write(f'Created {len(reviews_to_create)} reviews')
 
         self.stdout.write(self.style.SUCCESS('\nSample data creation complete!'))
         self.stdout.write(self.style.SUCCESS('\nYou can now login with:'))
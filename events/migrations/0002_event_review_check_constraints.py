@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-15 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="event",
+            constraint=models.CheckConstraint(
+                check=models.Q(("end_time__gt", models.F("start_time"))),
+                name="event_end_after_start",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="review",
+            constraint=models.CheckConstraint(
+                check=models.Q(("rating__gte", 1), ("rating__lte", 5)),
+                name="review_rating_range",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-15 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0002_event_review_check_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rsvp",
+            index=models.Index(
+                fields=["event", "user", "status"], name="rsvp_evt_usr_status_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-15 09:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0003_rsvp_event_user_status_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="review",
+            name="events_revi_event_i_158e14_idx",
+        ),
+    ]
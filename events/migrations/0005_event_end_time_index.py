@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-15 09:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0004_remove_review_event_rating_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["end_time"], name="events_even_end_tim_a200ed_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-15 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0005_event_end_time_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["is_public", "-start_time"],
+                name="events_even_is_publ_ca64e2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "-start_time"],
+                name="events_even_organiz_a5eaf5_idx",
+            ),
+        ),
+    ]
@@ -9,9 +9,15 @@ Following Django best practices:
 - Clear __str__ methods for admin interface
 """
 from django.db import models
+from django.db.models import (
+    Avg, BooleanField, Case, Count, F, Max, OuterRef, Prefetch, Q, Subquery,
+    Sum, When
+)
+from django.db.models.functions import Coalesce, Now
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 
 class UserProfile(models.Model):
@@ -43,12 +49,123 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
-    @property
+    def save(self, *args, **kwargs):
+        """Override save to reset cached properties."""
+        self.__dict__.pop('display_name', None)
+        super().save(*args, **kwargs)
+
+    @cached_property
     def display_name(self):
         """Return full_name if available, otherwise username."""
         return self.full_name or self.user.username
 
 
+def event_detail_prefetches():
+    """
+    Prefetches for an event's RSVPs and reviews with their users, stored
+    on `prefetched_rsvps` and `prefetched_reviews`. Only the user columns
+    the detail view renders are loaded. Returns fresh Prefetch objects so
+    callers can pass them to either prefetch_related() or
+    prefetch_related_objects().
+    """
+    return [
+        Prefetch(
+            'rsvps',
+            queryset=RSVP.objects.select_related('user').only(
+                'id', 'event_id', 'status', 'created_at', 'updated_at',
+                'user__id', 'user__username'
+            ),
+            to_attr='prefetched_rsvps',
+        ),
+        Prefetch(
+            'reviews',
+            queryset=Review.objects.select_related('user').only(
+                'id', 'event_id', 'rating', 'comment', 'created_at', 'updated_at',
+                'user__id', 'user__username'
+            ),
+            to_attr='prefetched_reviews',
+        ),
+    ]
+
+
+def related_aggregate(model, aggregate, **filters):
+    """
+    Correlated subquery computing `aggregate` over `model` rows of the
+    outer event. Each relation is aggregated on its own, so annotating
+    several of these never joins RSVPs and reviews into R x V rows.
+    Evaluates to NULL for events without matching rows.
+    """
+    return Subquery(
+        model.objects.filter(event=OuterRef('pk'), **filters)
+        .order_by()
+        .values('event')
+        .annotate(value=aggregate)
+        .values('value')
+    )
+
+
+class EventQuerySet(models.QuerySet):
+    """Custom QuerySet for Event with reusable query optimizations."""
+
+    def with_counts(self):
+        """
+        Annotate attendee/review counts, average rating and timing flags
+        in a single query. Avoids per-event queries and timezone.now()
+        calls when serializing lists.
+        """
+        return self.annotate(
+            attendee_count=Coalesce(
+                related_aggregate(RSVP, Count('pk'), status='going'), 0
+            ),
+            review_count=Coalesce(related_aggregate(Review, Count('pk')), 0),
+            average_rating=related_aggregate(Review, Avg('rating')),
+            is_upcoming=Case(
+                When(start_time__gt=Now(), then=True),
+                default=False,
+                output_field=BooleanField(),
+            ),
+            is_ongoing=Case(
+                When(start_time__lte=Now(), end_time__gte=Now(), then=True),
+                default=False,
+                output_field=BooleanField(),
+            ),
+        )
+
+    def change_summary(self):
+        """
+        Aggregate counts and latest change times of the matching events,
+        their RSVPs and reviews, plus how many are upcoming. The result
+        changes whenever anything a list of these events shows does, so it
+        can serve as a list-level version (e.g. for ETags), and its
+        event_total is the list's row count. Runs as one query with
+        per-event subqueries, so events, RSVPs and reviews are never
+        joined together.
+        """
+        return self.order_by().aggregate(
+            event_total=Count('pk'),
+            upcoming_total=Count('pk', filter=Q(start_time__gt=Now())),
+            updated_at=Max('updated_at'),
+            rsvp_total=Sum(related_aggregate(RSVP, Count('pk'))),
+            rsvps_updated_at=Max(related_aggregate(RSVP, Max('updated_at'))),
+            review_total=Sum(related_aggregate(Review, Count('pk'))),
+            reviews_updated_at=Max(related_aggregate(Review, Max('updated_at'))),
+        )
+
+    def with_last_modified(self):
+        """
+        Annotate the RSVP and review totals and their latest change times.
+        Together with updated_at these change whenever anything shown in
+        an event's detail does, so they can version cached payloads
+        without loading the related rows.
+        """
+        return self.annotate(
+            rsvp_total=Coalesce(related_aggregate(RSVP, Count('pk')), 0),
+            rsvps_updated_at=related_aggregate(RSVP, Max('updated_at')),
+            review_total=Coalesce(related_aggregate(Review, Count('pk')), 0),
+            reviews_updated_at=related_aggregate(Review, Max('updated_at')),
+        )
+
+
 class Event(models.Model):
     """
     Event model representing an event in the system.
@@ -68,6 +185,8 @@ class Event(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Event'
         verbose_name_plural = 'Events'
@@ -75,6 +194,16 @@ class Event(models.Model):
         indexes = [
             models.Index(fields=['organizer', 'is_public']),
             models.Index(fields=['start_time', 'is_public']),
+            models.Index(fields=['end_time']),
+            # Default list ordering, filtered by visibility or organizer
+            models.Index(fields=['is_public', '-start_time']),
+            models.Index(fields=['organizer', '-start_time']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(end_time__gt=F('start_time')),
+                name='event_end_after_start',
+            ),
         ]
 
     def __str__(self):
@@ -89,26 +218,47 @@ class Event(models.Model):
             })
 
     def save(self, *args, **kwargs):
-        """Override save to call full_clean for validation."""
-        self.full_clean()
+        """Override save to reset cached properties."""
+        for attr in (
+            'is_upcoming', 'is_ongoing', 'attendee_count', 'average_rating'
+        ):
+            self.__dict__.pop(attr, None)
         super().save(*args, **kwargs)
 
-    @property
+    @cached_property
     def is_upcoming(self):
         """Check if event is in the future."""
         return self.start_time > timezone.now()
 
-    @property
+    @cached_property
     def is_ongoing(self):
         """Check if event is currently happening."""
         now = timezone.now()
         return self.start_time <= now <= self.end_time
 
-    @property
+    @cached_property
     def attendee_count(self):
-        """Get count of confirmed attendees (Going status)."""
+        """
+        Get count of confirmed attendees (Going status).
+        The with_counts() annotation takes precedence when present.
+        """
         return self.rsvps.filter(status='going').count()
 
+    @cached_property
+    def average_rating(self):
+        """
+        Get average review rating rounded to 2 decimals, or None without
+        reviews. The with_counts() annotation (unrounded) takes precedence
+        when present, then prefetched reviews, before falling back to an
+        aggregate query.
+        """
+        if hasattr(self, 'prefetched_reviews'):
+            ratings = [review.rating for review in self.prefetched_reviews]
+            average = sum(ratings) / len(ratings) if ratings else None
+        else:
+            average = self.reviews.aggregate(average=Avg('rating'))['average']
+        return round(average, 2) if average is not None else None
+
 
 class RSVP(models.Model):
     """
@@ -146,6 +296,7 @@ class RSVP(models.Model):
         unique_together = ['event', 'user']
         indexes = [
             models.Index(fields=['event', 'status']),
+            models.Index(fields=['event', 'user', 'status'], name='rsvp_evt_usr_status_idx'),
         ]
 
     def __str__(self):
@@ -179,8 +330,11 @@ class Review(models.Model):
         verbose_name_plural = 'Reviews'
         ordering = ['-created_at']
         unique_together = ['event', 'user']
-        indexes = [
-            models.Index(fields=['event', 'rating']),
+        constraints = [
+            models.CheckConstraint(
+                check=Q(rating__gte=1, rating__lte=5),
+                name='review_rating_range',
+            ),
         ]
 
     def __str__(self):
@@ -193,8 +347,3 @@ class Review(models.Model):
             raise ValidationError({
                 'rating': 'Rating must be between 1 and 5.'
             })
-
-    def save(self, *args, **kwargs):
-        """Override save to call full_clean for validation."""
-        self.full_clean()
-        super().save(*args, **kwargs)
@@ -0,0 +1,57 @@
+"""
+Custom DRF pagination for Event Management System.
+
+Following best practices:
+- Avoid counting the same filtered rows twice per request
+- Keep responses bounded without COUNT(*) or OFFSET scans where possible
+"""
+from functools import partial
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KnownCountPaginator(Paginator):
+    """
+    Paginator that uses a total row count computed elsewhere, when given,
+    instead of running COUNT(*) itself.
+    """
+
+    def __init__(self, *args, count=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.known_count = count
+
+    @cached_property
+    def count(self):
+        if self.known_count is not None:
+            return self.known_count
+        return super().count
+
+
+class KnownCountPagination(PageNumberPagination):
+    """
+    Page number pagination that takes the total row count from the view
+    when it already has one. EventViewSet.list sets `known_count` from
+    the change_summary() it builds the ETag from, so the filtered events
+    are counted once per request.
+    """
+
+    # Total row count of the queryset being paginated; None runs COUNT(*)
+    known_count = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(
+            KnownCountPaginator, count=self.known_count
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+
+class NewestFirstCursorPagination(CursorPagination):
+    """
+    Cursor pagination for an event's RSVPs and reviews, newest first.
+    Keeps responses bounded without the COUNT(*) or OFFSET scans of page
+    number pagination.
+    """
+
+    ordering = '-created_at'
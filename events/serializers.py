@@ -10,10 +10,22 @@ Following best practices:
 """
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import F
 from django.utils import timezone
 from .models import UserProfile, Event, RSVP, Review
 
 
+class RatingField(serializers.FloatField):
+    """Read-only average rating, rounded to 2 decimals."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return round(super().to_representation(value), 2)
+
+
 class UserSerializer(serializers.ModelSerializer):
     """Basic user serializer for nested representations."""
     
@@ -58,16 +70,16 @@ class RSVPSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         event = data.get('event')
         
-        if event and not event.is_public:
+        if event and not event.is_public and self.instance is None:
             # Check if user is organizer or already has RSVP
-            if event.organizer != request.user:
+            if event.organizer_id != request.user.id:
                 # In a real app, you'd check an invitations table here
                 # For now, we'll allow if user already has an RSVP
-                existing_rsvp = RSVP.objects.filter(
+                has_rsvp = RSVP.objects.filter(
                     event=event,
                     user=request.user
-                ).first()
-                if not existing_rsvp and self.instance is None:
+                ).exists()
+                if not has_rsvp:
                     raise serializers.ValidationError(
                         "You cannot RSVP to private events you're not invited to."
                     )
@@ -103,13 +115,13 @@ class ReviewSerializer(serializers.ModelSerializer):
         
         # Check if user has RSVP'd with 'going' status
         if event:
-            rsvp = RSVP.objects.filter(
+            attended = RSVP.objects.filter(
                 event=event,
                 user=request.user,
                 status='going'
-            ).first()
+            ).exists()
             
-            if not rsvp:
+            if not attended:
                 raise serializers.ValidationError(
                     "You can only review events you've RSVP'd as 'Going'."
                 )
@@ -117,14 +129,66 @@ class ReviewSerializer(serializers.ModelSerializer):
         return data
 
 
+class RSVPListSerializer(serializers.Serializer):
+    """
+    Read-only RSVP serializer for dict rows from project().
+    Output matches RSVPSerializer without building model instances.
+    """
+    
+    id = serializers.IntegerField()
+    event = serializers.IntegerField(source='event_id')
+    user = serializers.IntegerField(source='user_id')
+    user_username = serializers.CharField(source='user__username')
+    event_title = serializers.CharField()
+    status = serializers.CharField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    @staticmethod
+    def project(queryset):
+        """Return the RSVP queryset as the dict rows this serializer reads."""
+        return queryset.values(
+            'id', 'event_id', 'user_id', 'user__username', 'status',
+            'created_at', 'updated_at', event_title=F('event__title')
+        )
+
+
+class ReviewListSerializer(serializers.Serializer):
+    """
+    Read-only review serializer for dict rows from project().
+    Output matches ReviewSerializer without building model instances.
+    """
+    
+    id = serializers.IntegerField()
+    event = serializers.IntegerField(source='event_id')
+    user = serializers.IntegerField(source='user_id')
+    user_username = serializers.CharField(source='user__username')
+    event_title = serializers.CharField()
+    rating = serializers.IntegerField()
+    comment = serializers.CharField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    @staticmethod
+    def project(queryset):
+        """Return the review queryset as the dict rows this serializer reads."""
+        return queryset.values(
+            'id', 'event_id', 'user_id', 'user__username', 'rating', 'comment',
+            'created_at', 'updated_at', event_title=F('event__title')
+        )
+
+
 class EventListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for event listings.
-    Uses select_related optimization for organizer.
+    Uses select_related optimization for organizer; counts and the
+    average rating come from with_counts() annotations.
     """
     
     organizer_username = serializers.CharField(source='organizer.username', read_only=True)
     attendee_count = serializers.IntegerField(read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
+    average_rating = RatingField()
     is_upcoming = serializers.BooleanField(read_only=True)
     
     class Meta:
@@ -132,7 +196,8 @@ class EventListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'location', 'start_time', 'end_time',
             'is_public', 'organizer', 'organizer_username',
-            'attendee_count', 'is_upcoming', 'created_at'
+            'attendee_count', 'review_count', 'average_rating',
+            'is_upcoming', 'created_at'
         ]
         read_only_fields = ['id', 'organizer', 'created_at']
 
@@ -140,16 +205,17 @@ class EventListSerializer(serializers.ModelSerializer):
 class EventDetailSerializer(serializers.ModelSerializer):
     """
     Detailed serializer for single event view.
-    Includes nested RSVPs and reviews with prefetch optimization.
+    Includes nested RSVPs and reviews; the event must be loaded with
+    event_detail_prefetches(), which stores them on prefetched_* attributes.
     """
     
     organizer = UserSerializer(read_only=True)
-    rsvps = RSVPSerializer(many=True, read_only=True)
-    reviews = ReviewSerializer(many=True, read_only=True)
+    rsvps = RSVPSerializer(source='prefetched_rsvps', many=True, read_only=True)
+    reviews = ReviewSerializer(source='prefetched_reviews', many=True, read_only=True)
     attendee_count = serializers.IntegerField(read_only=True)
     is_upcoming = serializers.BooleanField(read_only=True)
     is_ongoing = serializers.BooleanField(read_only=True)
-    average_rating = serializers.SerializerMethodField()
+    average_rating = RatingField()
     
     class Meta:
         model = Event
@@ -162,14 +228,6 @@ class EventDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'organizer', 'created_at', 'updated_at']
 
-    def get_average_rating(self, obj):
-        """Calculate average rating from reviews."""
-        reviews = obj.reviews.all()
-        if reviews:
-            total = sum(review.rating for review in reviews)
-            return round(total / len(reviews), 2)
-        return None
-
 
 class EventCreateUpdateSerializer(serializers.ModelSerializer):
     """
@@ -188,8 +246,11 @@ class EventCreateUpdateSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """Validate event dates."""
-        start_time = data.get('start_time', getattr(self.instance, 'start_time', None))
-        end_time = data.get('end_time', getattr(self.instance, 'end_time', None))
+        start_time = data.get('start_time')
+        end_time = data.get('end_time')
+        if self.instance:
+            start_time = start_time or self.instance.start_time
+            end_time = end_time or self.instance.end_time
         
         if start_time and end_time:
             if end_time <= start_time:
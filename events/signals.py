@@ -8,70 +8,201 @@ Following best practices:
 - Use post_save signals for async task triggering
 - Check for created flag to distinguish creates from updates
 - Avoid infinite loops with proper signal handling
+- Enqueue tasks with transaction.on_commit to avoid reading uncommitted data
 """
+from contextlib import contextmanager
+from functools import partial
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save
-from django.dispatch import receiver
 from .models import Event, RSVP, Review
 from .tasks import (
+    NOTIFY_FIELDS,
+    PENDING_UPDATE_FIELDS_TIMEOUT,
+    event_payload,
+    pending_update_field_keys,
+    review_payload,
+    rsvp_payload,
     send_event_creation_notification,
     send_event_update_notification,
     send_rsvp_notification_to_organizer,
     send_review_notification
 )
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds an update notification waits for further saves of the same event,
+# which are folded into it instead of notifying attendees again
+UPDATE_NOTIFICATION_DEBOUNCE = 10
+
+# Cache key of a marker that changes whenever user details shown in cached
+# event payloads (usernames, emails, names) may have changed
+USER_DETAILS_VERSION_KEY = 'user-details-version'
+USER_DETAILS_FIELDS = frozenset({'username', 'email', 'first_name', 'last_name'})
+
+# Per-thread flag set by notifications_suppressed()
+_state = threading.local()
+
+
+def _suppressed():
+    return getattr(_state, 'suppressed', False)
+
+
+@contextmanager
+def notifications_suppressed():
+    """
+    Skip notification tasks for saves made inside the block.
+
+    Wrap loops that call save() per row (imports, admin bulk edits,
+    data fixes) so they don't queue one email task per row:
+
+        with notifications_suppressed():
+            for rsvp in rsvps:
+                rsvp.save()
+    """
+    previous = _suppressed()
+    _state.suppressed = True
+    try:
+        yield
+    finally:
+        _state.suppressed = previous
+
+
+def user_details_version():
+    """
+    Return the current user details marker. Auth users have no updated_at,
+    so cache keys of payloads embedding user details include this instead.
+    A fresh marker is generated if the cached one was evicted.
+    """
+    return cache.get_or_set(USER_DETAILS_VERSION_KEY, time.time_ns, None)
+
+
+def _enqueue(task, countdown=None, **kwargs):
+    """Send a task to the broker, logging instead of raising on failure."""
+    try:
+        task.apply_async(kwargs=kwargs, countdown=countdown)
+    except Exception:
+        logger.exception("Failed to enqueue %s", task.name)
+
+
+def _schedule_update_notification(event_id, updated_fields):
+    """
+    Record the changed fields and, unless a notification for the event
+    is already pending, schedule one UPDATE_NOTIFICATION_DEBOUNCE seconds
+    out. Runs on commit, so rolled-back saves neither claim the debounce
+    key nor add fields. Only the event id is sent; the task loads the
+    event's current state and every field recorded by then. Saves that
+    don't say which fields changed record none.
+    """
+    field_keys = pending_update_field_keys(event_id)
+    cache.set_many(
+        {field_keys[field]: field for field in updated_fields},
+        timeout=PENDING_UPDATE_FIELDS_TIMEOUT,
+    )
+
+    if not cache.add(
+        f'ev-upd-notif:{event_id}', 1, timeout=UPDATE_NOTIFICATION_DEBOUNCE
+    ):
+        return
+
+    _enqueue(
+        send_event_update_notification,
+        countdown=UPDATE_NOTIFICATION_DEBOUNCE,
+        event_id=event_id,
+    )
+
 
-@receiver(post_save, sender=Event)
 def event_post_save(sender, instance, created, **kwargs):
     """
     Trigger email notifications when an event is created or updated.
+    Tasks are enqueued on commit. Creation tasks receive the email data
+    directly; update notifications are debounced and load the event's
+    state when they run.
     """
+    if _suppressed():
+        return
+
     if created:
         # New event created - notify organizer
-        try:
-            send_event_creation_notification.delay(
-                event_id=instance.id,
-                organizer_id=instance.organizer.id
-            )
-            logger.info(f"Queued creation notification for event {instance.id}")
-        except Exception as e:
-            logger.error(f"Error queuing event creation notification: {str(e)}")
+        transaction.on_commit(partial(
+            _enqueue,
+            send_event_creation_notification,
+            event_id=instance.id,
+            **event_payload(instance)
+        ))
+        logger.info("Queued creation notification for event %s", instance.id)
     else:
         # Event updated - notify attendees
-        # In production, you'd track which fields changed
-        try:
-            # For simplicity, we'll just say "Event details updated"
-            send_event_update_notification.delay(
-                event_id=instance.id,
-                updated_fields=['Event details']
-            )
-            logger.info(f"Queued update notification for event {instance.id}")
-        except Exception as e:
-            logger.error(f"Error queuing event update notification: {str(e)}")
-
-
-@receiver(post_save, sender=RSVP)
+        # Saves with update_fields tell us exactly what changed; skip
+        # those that don't touch anything attendees care about
+        update_fields = kwargs.get('update_fields') or frozenset()
+        changed_fields = sorted(update_fields & NOTIFY_FIELDS)
+        if update_fields and not changed_fields:
+            return
+
+        # Coalesce bursts of saves (e.g. admin bulk edits) into one email
+        # sent with the event's state once the burst is over
+        transaction.on_commit(partial(
+            _schedule_update_notification, instance.id, changed_fields
+        ))
+        logger.info("Queued update notification for event %s", instance.id)
+
+
 def rsvp_post_save(sender, instance, created, **kwargs):
     """
     Trigger email notification to organizer when someone RSVPs.
     """
-    try:
-        send_rsvp_notification_to_organizer.delay(rsvp_id=instance.id)
-        logger.info(f"Queued RSVP notification for RSVP {instance.id}")
-    except Exception as e:
-        logger.error(f"Error queuing RSVP notification: {str(e)}")
+    if _suppressed():
+        return
+
+    transaction.on_commit(partial(
+        _enqueue,
+        send_rsvp_notification_to_organizer,
+        rsvp_id=instance.id,
+        **rsvp_payload(instance)
+    ))
+    logger.info("Queued RSVP notification for RSVP %s", instance.id)
 
 
-@receiver(post_save, sender=Review)
 def review_post_save(sender, instance, created, **kwargs):
     """
     Trigger email notification to organizer when someone reviews their event.
     """
+    if _suppressed():
+        return
+
     if created:
-        try:
-            send_review_notification.delay(review_id=instance.id)
-            logger.info(f"Queued review notification for review {instance.id}")
-        except Exception as e:
-            logger.error(f"Error queuing review notification: {str(e)}")
+        transaction.on_commit(partial(
+            _enqueue,
+            send_review_notification,
+            review_id=instance.id,
+            **review_payload(instance)
+        ))
+        logger.info("Queued review notification for review %s", instance.id)
+
+
+def user_post_save(sender, instance, created, **kwargs):
+    """
+    Change the user details marker once a save that may have changed a
+    displayed field commits. New users aren't shown anywhere yet, and
+    saves limited to other fields (e.g. last_login) are skipped.
+    """
+    update_fields = kwargs.get('update_fields')
+    if created or (update_fields and not update_fields & USER_DETAILS_FIELDS):
+        return
+
+    transaction.on_commit(
+        lambda: cache.set(USER_DETAILS_VERSION_KEY, time.time_ns(), None)
+    )
+
+
+# dispatch_uid keeps each receiver registered once even if this module
+# is imported more than once
+post_save.connect(event_post_save, sender=Event, dispatch_uid='events.event_post_save')
+post_save.connect(rsvp_post_save, sender=RSVP, dispatch_uid='events.rsvp_post_save')
+post_save.connect(review_post_save, sender=Review, dispatch_uid='events.review_post_save')
+post_save.connect(user_post_save, sender=User, dispatch_uid='events.user_post_save')
@@ -13,221 +13,392 @@ Following best practices:
 - Logging for debugging
 """
 from celery import shared_task
-from django.core.mail import send_mail
+from celery.signals import worker_process_init, worker_process_shutdown
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
-from django.contrib.auth.models import User
+from django.db import OperationalError
+from django.template.loader import render_to_string
+from contextlib import contextmanager
+from itertools import islice
+from smtplib import SMTPConnectError, SMTPServerDisconnected
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared options for notification email tasks. Only transient failures
+# (dropped SMTP connections, database outages) are retried, with jittered
+# exponential backoff; permanent errors such as rejected recipients or bad
+# credentials fail immediately instead of burning retries.
+EMAIL_TASK_OPTIONS = {
+    'queue': 'emails',
+    'acks_late': True,
+    'autoretry_for': (SMTPServerDisconnected, SMTPConnectError, OperationalError),
+    'retry_backoff': 2,
+    'retry_backoff_max': 600,
+    'retry_jitter': True,
+    'max_retries': 5,
+}
 
-@shared_task(bind=True, max_retries=3)
-def send_event_creation_notification(self, event_id, organizer_id):
+# Number of BCC recipients per message for attendee fan-out emails
+EMAIL_BATCH_SIZE = 50
+
+# Rows fetched per database round-trip when streaming attendee emails
+ATTENDEE_CHUNK_SIZE = 500
+
+# Last RSVP id each update notification task has emailed, keyed by task id
+# (which retries keep), so a retried task only sends the remaining batches
+SENT_THROUGH_KEY = 'ev-upd-sent:{}'
+SENT_THROUGH_TIMEOUT = 60 * 60
+
+# Event fields whose changes attendees are notified about
+NOTIFY_FIELDS = frozenset({
+    'title', 'description', 'location', 'start_time', 'end_time', 'is_public'
+})
+
+# Fields changed by debounced event saves are kept until the update
+# notification has been sent: one cache key per event and field, so
+# concurrent saves never overwrite each other's fields
+PENDING_UPDATE_FIELD_KEY = 'ev-upd-fields:{}:{}'
+PENDING_UPDATE_FIELDS_TIMEOUT = 60 * 60
+
+# Plain-text email bodies; parsed once and reused by the cached template loader
+EVENT_CREATED_TEMPLATE = 'events/email/event_created.txt'
+EVENT_UPDATED_TEMPLATE = 'events/email/event_updated.txt'
+RSVP_CREATED_TEMPLATE = 'events/email/rsvp_created.txt'
+REVIEW_CREATED_TEMPLATE = 'events/email/review_created.txt'
+
+
+# SMTP connection kept open for the lifetime of a prefork worker process, so
+# the TCP/TLS handshake happens once per worker rather than once per email.
+# Each worker process runs one task at a time, so sharing it is safe.
+_worker_connection = None
+
+
+@worker_process_init.connect
+def _open_worker_connection(**kwargs):
+    global _worker_connection
+    _worker_connection = get_connection()
+
+
+@worker_process_shutdown.connect
+def _close_worker_connection(**kwargs):
+    if _worker_connection is not None:
+        _worker_connection.close()
+
+
+def _connection_alive(backend):
+    """
+    Check the backend's open SMTP session with a NOOP. Backends without
+    an open session (or without SMTP, e.g. locmem) count as alive.
+    """
+    smtp = getattr(backend, 'connection', None)
+    if smtp is None:
+        return True
+    try:
+        return smtp.noop()[0] == 250
+    except (SMTPServerDisconnected, OSError):
+        return False
+
+
+@contextmanager
+def _email_connection():
+    """
+    Yield the worker's persistent email connection, opening it if needed.
+    Outside a worker (e.g. eager tasks in tests) a fresh connection is
+    opened and closed around the block.
+    """
+    if _worker_connection is None:
+        with get_connection() as connection:
+            yield connection
+        return
+    
+    try:
+        # Servers drop idle sessions; reconnect now rather than failing
+        # (and retrying) on the first send
+        if not _connection_alive(_worker_connection):
+            _worker_connection.close()
+        _worker_connection.open()
+        yield _worker_connection
+    except SMTPServerDisconnected:
+        # Drop the dead socket so the retried task reconnects
+        _worker_connection.close()
+        raise
+
+
+def pending_update_field_keys(event_id):
+    """Map each of NOTIFY_FIELDS to its pending-update cache key for the event."""
+    return {
+        field: PENDING_UPDATE_FIELD_KEY.format(event_id, field)
+        for field in NOTIFY_FIELDS
+    }
+
+
+def _chunked(iterable, size):
+    """Yield lists of up to `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def event_payload(event):
+    """
+    Build the JSON-serializable event data used by notification emails.
+    Datetimes are ISO strings so the default JSON serializer can send them.
+    """
+    return {
+        'title': event.title,
+        'location': event.location,
+        'start_time': event.start_time.isoformat(),
+        'end_time': event.end_time.isoformat(),
+        'is_public': event.is_public,
+        'organizer_username': event.organizer.username,
+        'organizer_email': event.organizer.email,
+    }
+
+
+def rsvp_payload(rsvp):
+    """Build the JSON-serializable RSVP data used by notification emails."""
+    return {
+        'event_title': rsvp.event.title,
+        'organizer_username': rsvp.event.organizer.username,
+        'organizer_email': rsvp.event.organizer.email,
+        'username': rsvp.user.username,
+        'status': rsvp.get_status_display(),
+    }
+
+
+def review_payload(review):
+    """Build the JSON-serializable review data used by notification emails."""
+    return {
+        'event_title': review.event.title,
+        'organizer_username': review.event.organizer.username,
+        'organizer_email': review.event.organizer.email,
+        'username': review.user.username,
+        'rating': review.rating,
+        'comment': review.comment,
+    }
+
+
+def _load_event_payload(event_id):
+    """Load event payload from the database for messages queued with IDs only."""
+    from events.models import Event
+
+    event = Event.objects.select_related('organizer').only(
+        'id', 'title', 'location', 'start_time', 'end_time', 'is_public',
+        'organizer__username', 'organizer__email'
+    ).get(id=event_id)
+    return event_payload(event)
+
+
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_event_creation_notification(event_id=None, organizer_id=None, **payload):
     """
     Send email notification when a new event is created.
     
     Args:
         event_id: ID of the created event
-        organizer_id: ID of the event organizer
+        organizer_id: ID of the event organizer (kept for queued messages;
+            the organizer is loaded together with the event)
+        **payload: Event data built by event_payload(). When omitted,
+            the event is loaded from the database by event_id.
     """
-    try:
-        from events.models import Event
-        
-        event = Event.objects.get(id=event_id)
-        organizer = User.objects.get(id=organizer_id)
-        
-        subject = f'Event Created: {event.title}'
-        message = f"""
-        Hello {organizer.username},
-        
-        Your event "{event.title}" has been successfully created!
-        
-        Event Details:
-        - Title: {event.title}
-        - Location: {event.location}
-        - Start Time: {event.start_time}
-        - End Time: {event.end_time}
-        - Visibility: {'Public' if event.is_public else 'Private'}
-        
-        You can manage your event through the API.
-        
-        Best regards,
-        Event Management Team
-        """
-        
+    from events.models import Event
+    
+    if not payload:
+        try:
+            payload = _load_event_payload(event_id)
+        except Event.DoesNotExist:
+            logger.warning("Event %s no longer exists, skipping creation notification", event_id)
+            return "Event not found"
+    
+    subject = f"Event Created: {payload['title']}"
+    message = render_to_string(EVENT_CREATED_TEMPLATE, payload)
+    
+    with _email_connection() as connection:
         send_mail(
             subject,
             message,
             settings.DEFAULT_FROM_EMAIL,
-            [organizer.email],
+            [payload['organizer_email']],
             fail_silently=False,
+            connection=connection,
         )
-        
-        logger.info(f"Event creation notification sent for event {event_id}")
-        return f"Email sent to {organizer.email}"
-        
-    except Exception as exc:
-        logger.error(f"Error sending event creation notification: {str(exc)}")
-        raise self.retry(exc=exc, countdown=60)
+    
+    logger.info("Event creation notification sent for event %s", event_id)
+    return f"Email sent to {payload['organizer_email']}"
 
 
-@shared_task(bind=True, max_retries=3)
-def send_event_update_notification(self, event_id, updated_fields):
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_event_update_notification(event_id, updated_fields=None, **payload):
     """
     Send email notification to all attendees when an event is updated.
     
     Args:
         event_id: ID of the updated event
-        updated_fields: List of field names that were updated
+        updated_fields: List of field names that were updated. When
+            omitted, the fields recorded by debounced saves are used and
+            cleared once the task finishes, so retries still see them.
+        **payload: Event data built by event_payload(). When omitted,
+            the event is loaded from the database by event_id.
     """
-    try:
-        from events.models import Event, RSVP
-        
-        event = Event.objects.get(id=event_id)
-        
-        # Get all users who RSVP'd as 'going'
-        rsvps = RSVP.objects.filter(
-            event=event,
-            status='going'
-        ).select_related('user')
-        
-        attendee_emails = [rsvp.user.email for rsvp in rsvps if rsvp.user.email]
-        
-        if not attendee_emails:
-            logger.info(f"No attendees to notify for event {event_id}")
-            return "No attendees to notify"
-        
-        subject = f'Event Updated: {event.title}'
-        message = f"""
-        Hello,
-        
-        The event "{event.title}" you're attending has been updated.
-        
-        Updated fields: {', '.join(updated_fields)}
-        
-        Current Event Details:
-        - Title: {event.title}
-        - Location: {event.location}
-        - Start Time: {event.start_time}
-        - End Time: {event.end_time}
-        
-        Please check the latest details through the API.
-        
-        Best regards,
-        Event Management Team
-        """
-        
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            attendee_emails,
-            fail_silently=False,
-        )
-        
-        logger.info(f"Event update notification sent to {len(attendee_emails)} attendees")
-        return f"Email sent to {len(attendee_emails)} attendees"
-        
-    except Exception as exc:
-        logger.error(f"Error sending event update notification: {str(exc)}")
-        raise self.retry(exc=exc, countdown=60)
+    from events.models import Event, RSVP
+    
+    pending_keys = []
+    if updated_fields is None:
+        pending_keys = list(pending_update_field_keys(event_id).values())
+        # Full saves record no fields, so fall back only when none were
+        updated_fields = sorted(cache.get_many(pending_keys).values()) or ['Event details']
+    
+    attendees = (
+        RSVP.objects.filter(event_id=event_id, status='going')
+        .exclude(user__email='')
+        .exclude(user__email__isnull=True)
+    )
+    
+    # Most events have no attendees yet; check before loading the event
+    # and rendering the email body
+    if not attendees.exists():
+        logger.info("No attendees to notify for event %s", event_id)
+        cache.delete_many(pending_keys)
+        return "No attendees to notify"
+    
+    if not payload:
+        try:
+            payload = _load_event_payload(event_id)
+        except Event.DoesNotExist:
+            logger.warning("Event %s no longer exists, skipping update notification", event_id)
+            cache.delete_many(pending_keys)
+            return "Event not found"
+    
+    # A retry of this task skips the batches an earlier attempt sent
+    task_id = send_event_update_notification.request.id
+    sent_through_key = SENT_THROUGH_KEY.format(task_id) if task_id else None
+    sent_through = cache.get(sent_through_key, 0) if sent_through_key else 0
+    
+    # Stream attendee emails so memory stays bounded by the chunk size
+    # rather than the attendee count
+    attendee_emails = (
+        attendees.filter(pk__gt=sent_through)
+        .order_by('pk')
+        .values_list('pk', 'user__email')
+        .iterator(chunk_size=ATTENDEE_CHUNK_SIZE)
+    )
+    
+    subject = f"Event Updated: {payload['title']}"
+    message = render_to_string(
+        EVENT_UPDATED_TEMPLATE,
+        {**payload, 'updated_fields': updated_fields}
+    )
+    
+    # BCC attendees in batches so recipients don't see each other's addresses
+    sent_count = 0
+    with _email_connection() as connection:
+        for batch in _chunked(attendee_emails, EMAIL_BATCH_SIZE):
+            EmailMessage(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                bcc=[email for _, email in batch],
+                connection=connection,
+            ).send()
+            sent_count += len(batch)
+            if sent_through_key:
+                cache.set(sent_through_key, batch[-1][0], SENT_THROUGH_TIMEOUT)
+    
+    if sent_through_key:
+        cache.delete(sent_through_key)
+    cache.delete_many(pending_keys)
+    logger.info("Event update notification sent to %s attendees", sent_count)
+    return f"Email sent to {sent_count} attendees"
 
 
-@shared_task(bind=True, max_retries=3)
-def send_rsvp_notification_to_organizer(self, rsvp_id):
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_rsvp_notification_to_organizer(rsvp_id=None, **payload):
     """
     Send email notification to event organizer when someone RSVPs.
     
     Args:
         rsvp_id: ID of the RSVP
+        **payload: RSVP data built by rsvp_payload(). When omitted,
+            the RSVP is loaded from the database by rsvp_id.
     """
-    try:
+    if not payload:
         from events.models import RSVP
         
-        rsvp = RSVP.objects.select_related('event', 'user').get(id=rsvp_id)
-        organizer = rsvp.event.organizer
-        
-        if not organizer.email:
-            logger.info(f"Organizer has no email for RSVP {rsvp_id}")
-            return "Organizer has no email"
-        
-        subject = f'New RSVP for {rsvp.event.title}'
-        message = f"""
-        Hello {organizer.username},
-        
-        {rsvp.user.username} has RSVP'd to your event "{rsvp.event.title}".
-        
-        Status: {rsvp.get_status_display()}
-        
-        You can view all RSVPs for your event through the API.
-        
-        Best regards,
-        Event Management Team
-        """
-        
+        try:
+            rsvp = RSVP.objects.select_related('event__organizer', 'user').only(
+                'status', 'event__title', 'event__organizer__username',
+                'event__organizer__email', 'user__username'
+            ).get(id=rsvp_id)
+        except RSVP.DoesNotExist:
+            logger.warning("RSVP %s no longer exists, skipping notification", rsvp_id)
+            return "RSVP not found"
+        payload = rsvp_payload(rsvp)
+    
+    if not payload['organizer_email']:
+        logger.info("Organizer has no email for RSVP %s", rsvp_id)
+        return "Organizer has no email"
+    
+    subject = f"New RSVP for {payload['event_title']}"
+    message = render_to_string(RSVP_CREATED_TEMPLATE, payload)
+    
+    with _email_connection() as connection:
         send_mail(
             subject,
             message,
             settings.DEFAULT_FROM_EMAIL,
-            [organizer.email],
+            [payload['organizer_email']],
             fail_silently=False,
+            connection=connection,
         )
-        
-        logger.info(f"RSVP notification sent to organizer for RSVP {rsvp_id}")
-        return f"Email sent to {organizer.email}"
-        
-    except Exception as exc:
-        logger.error(f"Error sending RSVP notification: {str(exc)}")
-        raise self.retry(exc=exc, countdown=60)
+    
+    logger.info("RSVP notification sent to organizer for RSVP %s", rsvp_id)
+    return f"Email sent to {payload['organizer_email']}"
 
 
-@shared_task(bind=True, max_retries=3)
-def send_review_notification(self, review_id):
+@shared_task(**EMAIL_TASK_OPTIONS)
+def send_review_notification(review_id=None, **payload):
     """
     Send email notification to event organizer when someone reviews their event.
     
     Args:
         review_id: ID of the review
+        **payload: Review data built by review_payload(). When omitted,
+            the review is loaded from the database by review_id.
     """
-    try:
+    if not payload:
         from events.models import Review
         
-        review = Review.objects.select_related('event', 'user').get(id=review_id)
-        organizer = review.event.organizer
-        
-        if not organizer.email:
-            logger.info(f"Organizer has no email for review {review_id}")
-            return "Organizer has no email"
-        
-        subject = f'New Review for {review.event.title}'
-        message = f"""
-        Hello {organizer.username},
-        
-        {review.user.username} has reviewed your event "{review.event.title}".
-        
-        Rating: {review.rating}/5
-        Comment: {review.comment}
-        
-        You can view all reviews for your event through the API.
-        
-        Best regards,
-        Event Management Team
-        """
-        
+        try:
+            review = Review.objects.select_related('event__organizer', 'user').only(
+                'rating', 'comment', 'event__title', 'event__organizer__username',
+                'event__organizer__email', 'user__username'
+            ).get(id=review_id)
+        except Review.DoesNotExist:
+            logger.warning("Review %s no longer exists, skipping notification", review_id)
+            return "Review not found"
+        payload = review_payload(review)
+    
+    if not payload['organizer_email']:
+        logger.info("Organizer has no email for review %s", review_id)
+        return "Organizer has no email"
+    
+    subject = f"New Review for {payload['event_title']}"
+    message = render_to_string(REVIEW_CREATED_TEMPLATE, payload)
+    
+    with _email_connection() as connection:
         send_mail(
             subject,
             message,
             settings.DEFAULT_FROM_EMAIL,
-            [organizer.email],
+            [payload['organizer_email']],
             fail_silently=False,
+            connection=connection,
         )
-        
-        logger.info(f"Review notification sent to organizer for review {review_id}")
-        return f"Email sent to {organizer.email}"
-        
-    except Exception as exc:
-        logger.error(f"Error sending review notification: {str(exc)}")
-        raise self.retry(exc=exc, countdown=60)
+    
+    logger.info("Review notification sent to organizer for review %s", review_id)
+    return f"Email sent to {payload['organizer_email']}"
 
 
 @shared_task
@@ -240,12 +411,13 @@ def cleanup_old_events():
     from django.utils import timezone
     from datetime import timedelta
     
-    # Find events that ended more than 30 days ago
+    # Find events that ended more than 30 days ago; the end_time index
+    # turns this into a range scan instead of a full table scan
     cutoff_date = timezone.now() - timedelta(days=30)
     old_events = Event.objects.filter(end_time__lt=cutoff_date)
     
     count = old_events.count()
-    logger.info(f"Found {count} events older than 30 days")
+    logger.info("Found %s events older than 30 days", count)
     
     # In a real app, you might archive these instead of deleting
     # For now, we'll just log them
@@ -11,24 +11,46 @@ Testing:
 Run with: pytest
 or: python manage.py test
 """
-from django.test import TestCase
+from smtplib import SMTPServerDisconnected
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase
 from rest_framework import status
 from events.models import Event, RSVP, Review, UserProfile
-from events.serializers import EventDetailSerializer, RSVPSerializer, ReviewSerializer
+from events.pagination import KnownCountPaginator
+from events.serializers import (
+    EventDetailSerializer, EventListSerializer, RSVPSerializer, ReviewSerializer
+)
+from events.signals import UPDATE_NOTIFICATION_DEBOUNCE, notifications_suppressed
+from events.tasks import (
+    EMAIL_BATCH_SIZE,
+    pending_update_field_keys,
+    send_event_creation_notification,
+    send_event_update_notification,
+)
+
+# Tests that clear the cache use a private in-memory one, so they never
+# flush a shared Redis database
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
 
 
 class UserProfileModelTest(TestCase):
     """Test UserProfile model."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
             username='testuser',
-            email='test@example.com',
-            password='testpass123'
+            email='test@example.com'
         )
 
     def test_create_profile(self):
@@ -47,18 +69,29 @@ class UserProfileModelTest(TestCase):
         profile = UserProfile.objects.create(user=self.user)
         self.assertEqual(profile.display_name, 'testuser')
 
+    def test_save_resets_cached_display_name(self):
+        """Test save() drops a cached display_name."""
+        profile = UserProfile.objects.create(user=self.user)
+        self.assertEqual(profile.display_name, 'testuser')
+
+        profile.full_name = 'Test User'
+        profile.save()
+
+        self.assertEqual(profile.display_name, 'Test User')
+
 
 class EventModelTest(TestCase):
     """Test Event model and business logic."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
-            username='organizer',
-            email='organizer@example.com',
-            password='testpass123'
-        )
-        self.start_time = timezone.now() + timedelta(days=1)
-        self.end_time = self.start_time + timedelta(hours=2)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.user2, cls.user3 = User.objects.bulk_create([
+            User(username='organizer', email='organizer@example.com'),
+            User(username='user2'),
+            User(username='user3'),
+        ])
+        cls.start_time = timezone.now() + timedelta(days=1)
+        cls.end_time = cls.start_time + timedelta(hours=2)
 
     def test_create_event(self):
         """Test creating an event."""
@@ -76,10 +109,10 @@ class EventModelTest(TestCase):
         self.assertFalse(event.is_ongoing)
 
     def test_event_validation_end_before_start(self):
-        """Test that event validation prevents end_time before start_time."""
-        from django.core.exceptions import ValidationError
+        """Test that the database rejects end_time before start_time."""
+        from django.db import IntegrityError
         
-        with self.assertRaises(ValidationError):
+        with self.assertRaises(IntegrityError):
             event = Event(
                 title='Test Event',
                 description='Test description',
@@ -103,25 +136,86 @@ class EventModelTest(TestCase):
             is_public=True
         )
         
-        user2 = User.objects.create_user(username='user2', password='test123')
-        user3 = User.objects.create_user(username='user3', password='test123')
-        
-        RSVP.objects.create(event=event, user=user2, status='going')
-        RSVP.objects.create(event=event, user=user3, status='maybe')
+        RSVP.objects.create(event=event, user=self.user2, status='going')
+        RSVP.objects.create(event=event, user=self.user3, status='maybe')
         
         self.assertEqual(event.attendee_count, 1)  # Only 'going' status
 
+    def test_with_counts_annotations(self):
+        """Test counts and average rating are annotated in one query."""
+        event = Event.objects.create(
+            title='Test Event',
+            description='Test description',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+
+        RSVP.objects.create(event=event, user=self.user2, status='going')
+        RSVP.objects.create(event=event, user=self.user3, status='going')
+        Review.objects.create(event=event, user=self.user2, rating=4)
+        Review.objects.create(event=event, user=self.user3, rating=5)
+
+        with self.assertNumQueries(1):
+            annotated = Event.objects.with_counts().get(pk=event.pk)
+            self.assertEqual(annotated.attendee_count, 2)
+            self.assertEqual(annotated.review_count, 2)
+            self.assertEqual(annotated.average_rating, 4.5)
+
+    def test_average_rating_is_rounded(self):
+        """Test the average rating is rounded to 2 decimals everywhere."""
+        event = Event.objects.create(
+            title='Test Event',
+            description='Test description',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        Review.objects.bulk_create([
+            Review(event=event, user=user, rating=rating)
+            for user, rating in ((self.user, 4), (self.user2, 5), (self.user3, 5))
+        ])
+
+        self.assertEqual(event.average_rating, 4.67)
+        annotated = Event.objects.with_counts().get(pk=event.pk)
+        self.assertEqual(EventListSerializer(annotated).data['average_rating'], 4.67)
+
+    def test_save_resets_cached_average_rating(self):
+        """Test save() drops a cached average rating."""
+        event = Event.objects.create(
+            title='Test Event',
+            description='Test description',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        self.assertIsNone(event.average_rating)
+
+        Review.objects.create(event=event, user=self.user2, rating=4)
+        event.save()
+
+        self.assertEqual(event.average_rating, 4)
+
 
 class RSVPModelTest(TestCase):
     """Test RSVP model."""
 
-    def setUp(self):
-        self.organizer = User.objects.create_user(username='organizer', password='test123')
-        self.user = User.objects.create_user(username='attendee', password='test123')
-        self.event = Event.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizer, cls.user = User.objects.bulk_create([
+            User(username='organizer'),
+            User(username='attendee'),
+        ])
+        cls.event = Event.objects.create(
             title='Test Event',
             description='Test description',
-            organizer=self.organizer,
+            organizer=cls.organizer,
             location='Test Location',
             start_time=timezone.now() + timedelta(days=1),
             end_time=timezone.now() + timedelta(days=1, hours=2),
@@ -150,13 +244,16 @@ class RSVPModelTest(TestCase):
 class ReviewModelTest(TestCase):
     """Test Review model."""
 
-    def setUp(self):
-        self.organizer = User.objects.create_user(username='organizer', password='test123')
-        self.user = User.objects.create_user(username='reviewer', password='test123')
-        self.event = Event.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizer, cls.user = User.objects.bulk_create([
+            User(username='organizer'),
+            User(username='reviewer'),
+        ])
+        cls.event = Event.objects.create(
             title='Test Event',
             description='Test description',
-            organizer=self.organizer,
+            organizer=cls.organizer,
             location='Test Location',
             start_time=timezone.now() + timedelta(days=1),
             end_time=timezone.now() + timedelta(days=1, hours=2),
@@ -175,9 +272,9 @@ class ReviewModelTest(TestCase):
 
     def test_review_rating_validation(self):
         """Test that review rating must be between 1 and 5."""
-        from django.core.exceptions import ValidationError
+        from django.db import IntegrityError
         
-        with self.assertRaises(ValidationError):
+        with self.assertRaises(IntegrityError):
             review = Review(
                 event=self.event,
                 user=self.user,
@@ -190,19 +287,14 @@ class ReviewModelTest(TestCase):
 class EventAPITest(APITestCase):
     """Test Event API endpoints."""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
-        )
-        self.other_user = User.objects.create_user(
-            username='otheruser',
-            password='testpass123'
-        )
-        self.start_time = timezone.now() + timedelta(days=1)
-        self.end_time = self.start_time + timedelta(hours=2)
+    @classmethod
+    def setUpTestData(cls):
+        cls.user, cls.other_user = User.objects.bulk_create([
+            User(username='testuser', email='test@example.com'),
+            User(username='otheruser'),
+        ])
+        cls.start_time = timezone.now() + timedelta(days=1)
+        cls.end_time = cls.start_time + timedelta(hours=2)
 
     def test_list_events_unauthenticated(self):
         """Test listing public events without authentication."""
@@ -220,6 +312,56 @@ class EventAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+    def test_list_cache_not_shared_with_authenticated_users(self):
+        """Test authenticated users aren't served the anonymous list cache."""
+        Event.objects.create(
+            title='Public Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        self.client.get('/api/events/')
+        
+        Event.objects.create(
+            title='Private Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=False
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        response = self.client.get('/api/events/')
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_list_events_conditional_get(self):
+        """Test the list answers 304 for a current ETag and 200 after changes."""
+        event = Event.objects.create(
+            title='Public Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        self.client.force_authenticate(user=self.other_user)
+        etag = self.client.get('/api/events/')['ETag']
+        
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        RSVP.objects.create(event=event, user=self.other_user, status='going')
+        
+        response = self.client.get('/api/events/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['attendee_count'], 1)
+
     def test_create_event_authenticated(self):
         """Test creating an event with authentication."""
         self.client.force_authenticate(user=self.user)
@@ -328,6 +470,27 @@ class EventAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['status'], 'going')
 
+    def test_rsvp_rejects_invalid_status(self):
+        """Test unknown or non-string statuses are rejected with 400."""
+        event = Event.objects.create(
+            title='Public Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+
+        self.client.force_authenticate(user=self.other_user)
+
+        for value in ('attending', ['going']):
+            response = self.client.post(
+                f'/api/events/{event.id}/rsvp/', {'status': value}, format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(RSVP.objects.filter(event=event).exists())
+
     def test_add_review_to_event(self):
         """Test adding a review to an event."""
         event = Event.objects.create(
@@ -354,19 +517,159 @@ class EventAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['rating'], 5)
 
+    def test_duplicate_review_rejected(self):
+        """Test a second review of the same event returns 400."""
+        event = Event.objects.create(
+            title='Event to Review',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        RSVP.objects.create(event=event, user=self.other_user, status='going')
+        Review.objects.create(event=event, user=self.other_user, rating=4)
+        
+        self.client.force_authenticate(user=self.other_user)
+        
+        response = self.client.post(f'/api/events/{event.id}/review/', {'rating': 5})
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Review.objects.get(event=event).rating, 4)
+
+    def test_event_rsvps_are_cursor_paginated(self):
+        """Test the nested RSVP list returns bounded pages with a next link."""
+        event = Event.objects.create(
+            title='Popular Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        attendees = User.objects.bulk_create([
+            User(username=f'attendee{i}') for i in range(11)
+        ])
+        RSVP.objects.bulk_create([RSVP(event=event, user=user) for user in attendees])
+        
+        response = self.client.get(f'/api/events/{event.id}/rsvps/')
+        self.assertEqual(len(response.data['results']), 10)
+        
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+    def test_event_rsvps_count_only_is_parsed_as_boolean(self):
+        """Test count_only=1 returns counts while count_only=false lists RSVPs."""
+        event = Event.objects.create(
+            title='Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        RSVP.objects.create(event=event, user=self.other_user, status='going')
+
+        response = self.client.get(f'/api/events/{event.id}/rsvps/?count_only=1')
+        self.assertEqual(response.data, {'rsvp_count': 1, 'attendee_count': 1})
+
+        for value in ('0', 'false'):
+            response = self.client.get(
+                f'/api/events/{event.id}/rsvps/?count_only={value}'
+            )
+            self.assertEqual(len(response.data['results']), 1)
+
+    def test_retrieve_event_includes_current_user_rsvp(self):
+        """Test the detail view reports the requesting user's RSVP status."""
+        event = Event.objects.create(
+            title='Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        RSVP.objects.create(event=event, user=self.other_user, status='maybe')
+        
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(f'/api/events/{event.id}/')
+        self.assertEqual(response.data['current_user_rsvp'], 'maybe')
+        
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(f'/api/events/{event.id}/')
+        self.assertIsNone(response.data['current_user_rsvp'])
+
+    def test_retrieve_event_reflects_new_rsvp(self):
+        """Test cached event details are refreshed when an RSVP changes."""
+        event = Event.objects.create(
+            title='Cached Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        
+        response = self.client.get(f'/api/events/{event.id}/')
+        self.assertEqual(response.data['attendee_count'], 0)
+        
+        RSVP.objects.create(event=event, user=self.other_user, status='going')
+        
+        response = self.client.get(f'/api/events/{event.id}/')
+        self.assertEqual(response.data['attendee_count'], 1)
+        self.assertEqual(len(response.data['rsvps']), 1)
+
+    def test_retrieve_event_reflects_user_changes(self):
+        """Test cached event details are refreshed when shown user details change."""
+        event = Event.objects.create(
+            title='Cached Event',
+            description='Test',
+            organizer=self.user,
+            location='Test Location',
+            start_time=self.start_time,
+            end_time=self.end_time,
+            is_public=True
+        )
+        RSVP.objects.create(event=event, user=self.other_user, status='going')
+
+        response = self.client.get(f'/api/events/{event.id}/')
+        etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.email = 'new@example.com'
+            self.user.save(update_fields=['email'])
+            self.other_user.username = 'renamed'
+            self.other_user.save()
+
+        response = self.client.get(
+            f'/api/events/{event.id}/', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['organizer']['email'], 'new@example.com')
+        self.assertEqual(response.data['rsvps'][0]['user_username'], 'renamed')
+
 
 class PermissionTest(APITestCase):
     """Test custom permissions."""
 
-    def setUp(self):
-        self.organizer = User.objects.create_user(username='organizer', password='test123')
-        self.invited_user = User.objects.create_user(username='invited', password='test123')
-        self.uninvited_user = User.objects.create_user(username='uninvited', password='test123')
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizer, cls.invited_user, cls.uninvited_user = User.objects.bulk_create([
+            User(username='organizer'),
+            User(username='invited'),
+            User(username='uninvited'),
+        ])
         
-        self.private_event = Event.objects.create(
+        cls.private_event = Event.objects.create(
             title='Private Event',
             description='Test',
-            organizer=self.organizer,
+            organizer=cls.organizer,
             location='Test Location',
             start_time=timezone.now() + timedelta(days=1),
             end_time=timezone.now() + timedelta(days=1, hours=2),
@@ -375,8 +678,8 @@ class PermissionTest(APITestCase):
         
         # Simulate invitation by creating an RSVP
         RSVP.objects.create(
-            event=self.private_event,
-            user=self.invited_user,
+            event=cls.private_event,
+            user=cls.invited_user,
             status='going'
         )
 
@@ -395,8 +698,187 @@ class PermissionTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_uninvited_user_cannot_view_private_event(self):
-        """Test that uninvited users cannot view private event."""
+        """Test that private events are hidden from uninvited users."""
         self.client.force_authenticate(user=self.uninvited_user)
         response = self.client.get(f'/api/events/{self.private_event.id}/')
         
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_uninvited_user_cannot_rsvp_to_private_event(self):
+        """Test that uninvited users can't RSVP to a private event."""
+        self.client.force_authenticate(user=self.uninvited_user)
+        response = self.client.post(
+            f'/api/events/{self.private_event.id}/rsvp/', {'status': 'going'}
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(RSVP.objects.filter(user=self.uninvited_user).exists())
+
+
+class KnownCountPaginationTest(APITestCase):
+    """Test the event list counts the filtered events once per request."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='pass')
+        cls.start_time = timezone.now() + timedelta(days=1)
+        Event.objects.bulk_create([
+            Event(
+                title=f'Event {i}',
+                description='Test',
+                organizer=cls.user,
+                location='Test Location',
+                start_time=cls.start_time,
+                end_time=cls.start_time + timedelta(hours=2),
+            )
+            for i in range(15)
+        ])
+
+    def test_list_reuses_change_summary_count(self):
+        """Test list pages run the change summary and page fetch only."""
+        self.client.force_authenticate(user=self.user)
+
+        for page, size in ((1, 10), (2, 5)):
+            with self.assertNumQueries(2):
+                response = self.client.get('/api/events/', {'page': page})
+            self.assertEqual(response.data['count'], 15)
+            self.assertEqual(len(response.data['results']), size)
+
+        response = self.client.get('/api/events/', {'location': 'Elsewhere'})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_paginator_counts_without_known_count(self):
+        """Test COUNT(*) runs only when no count is given."""
+        events = Event.objects.order_by('pk')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(KnownCountPaginator(events, 10).count, 15)
+        with self.assertNumQueries(0):
+            self.assertEqual(KnownCountPaginator(events, 10, count=15).count, 15)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NotificationTaskTest(TestCase):
+    """Test Celery notification tasks."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.organizer = User.objects.create(username='organizer')
+        cls.event = Event.objects.create(
+            title='Test Event',
+            description='Test description',
+            organizer=cls.organizer,
+            location='Test Location',
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=2),
+            is_public=True
+        )
+
+    def test_update_notification_batches_bcc(self):
+        """Test attendees are BCC'd in batches over one connection."""
+        attendees = User.objects.bulk_create([
+            User(username=f'attendee{i}', email=f'attendee{i}@example.com')
+            for i in range(EMAIL_BATCH_SIZE + 1)
+        ])
+        RSVP.objects.bulk_create([
+            RSVP(event=self.event, user=user, status='going') for user in attendees
+        ])
+
+        send_event_update_notification.apply(
+            kwargs={'event_id': self.event.id, 'updated_fields': ['title']}
+        )
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(len(mail.outbox[0].bcc), EMAIL_BATCH_SIZE)
+        self.assertEqual(len(mail.outbox[1].bcc), 1)
+        self.assertEqual(mail.outbox[0].to, [])
+
+    def test_update_notification_retry_skips_sent_batches(self):
+        """Test a retry after a dropped connection only sends the remaining batches."""
+        attendees = User.objects.bulk_create([
+            User(username=f'attendee{i}', email=f'attendee{i}@example.com')
+            for i in range(EMAIL_BATCH_SIZE + 1)
+        ])
+        RSVP.objects.bulk_create([
+            RSVP(event=self.event, user=user, status='going') for user in attendees
+        ])
+
+        send = EmailMessage.send
+        calls = []
+
+        def drop_second_batch(message, *args, **kwargs):
+            calls.append(message)
+            if len(calls) == 2:
+                raise SMTPServerDisconnected('Connection unexpectedly closed')
+            return send(message, *args, **kwargs)
+
+        with mock.patch.object(
+            EmailMessage, 'send', autospec=True, side_effect=drop_second_batch
+        ):
+            send_event_update_notification.apply(
+                kwargs={'event_id': self.event.id, 'updated_fields': ['title']}
+            )
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(
+            [len(message.bcc) for message in mail.outbox], [EMAIL_BATCH_SIZE, 1]
+        )
+
+    def test_notification_for_deleted_event_is_not_retried(self):
+        """Test a missing event ends the task instead of retrying."""
+        result = send_event_creation_notification.apply(kwargs={'event_id': 0})
+
+        self.assertTrue(result.successful())
+        self.assertEqual(result.result, 'Event not found')
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_suppressed_saves_queue_no_notifications(self):
+        """Test saves inside notifications_suppressed() enqueue no tasks."""
+        attendee = User.objects.create(username='attendee', email='a@example.com')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with notifications_suppressed():
+                RSVP.objects.create(event=self.event, user=attendee, status='going')
+
+        self.assertEqual(callbacks, [])
+
+    def test_update_notifications_are_debounced(self):
+        """Test a burst of saves schedules one notification with every changed field."""
+        cache.clear()
+        attendee = User.objects.create(username='attendee', email='a@example.com')
+        with notifications_suppressed():
+            RSVP.objects.create(event=self.event, user=attendee, status='going')
+
+        with mock.patch.object(send_event_update_notification, 'apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.event.title = 'Renamed Event'
+                self.event.save(update_fields=['title'])
+            with self.captureOnCommitCallbacks(execute=True):
+                self.event.location = 'New Location'
+                self.event.save(update_fields=['location'])
+            with self.captureOnCommitCallbacks(execute=True):
+                # Full saves don't say what changed and add no fields
+                self.event.save()
+
+        apply_async.assert_called_once_with(
+            kwargs={'event_id': self.event.id},
+            countdown=UPDATE_NOTIFICATION_DEBOUNCE,
+        )
+
+        send_event_update_notification.apply(kwargs={'event_id': self.event.id})
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('Updated fields: location, title', mail.outbox[0].body)
+        self.assertIn('New Location', mail.outbox[0].body)
+        self.assertEqual(
+            cache.get_many(pending_update_field_keys(self.event.id).values()), {}
+        )
+
+    def test_update_notification_without_attendees_sends_nothing(self):
+        """Test the task stops before building the email when nobody is going."""
+        result = send_event_update_notification.apply(
+            kwargs={'event_id': self.event.id, 'updated_fields': ['title']}
+        )
+
+        self.assertEqual(result.result, 'No attendees to notify')
+        self.assertEqual(len(mail.outbox), 0)
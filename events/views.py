@@ -8,39 +8,66 @@ Following best practices:
 - Custom actions for nested resources
 - Cache frequently accessed data
 """
-from rest_framework import viewsets, status, filters
+import hashlib
+
+from rest_framework import viewsets, status, filters, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
-from django.db.models import Q, Prefetch, Count
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q, Subquery, prefetch_related_objects
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.utils.http import quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Event, RSVP, Review, UserProfile
+from .decorators import cache_page_if_anonymous
+from .filters import EventFilterSet, ReviewFilterSet, RSVPFilterSet
+from .models import Event, RSVP, Review, UserProfile, event_detail_prefetches
+from .pagination import KnownCountPagination, NewestFirstCursorPagination
 from .serializers import (
     EventListSerializer, EventDetailSerializer, EventCreateUpdateSerializer,
-    RSVPSerializer, ReviewSerializer, UserProfileSerializer
+    RSVPSerializer, ReviewSerializer, UserProfileSerializer,
+    RSVPListSerializer, ReviewListSerializer
 )
+from .signals import USER_DETAILS_VERSION_KEY, user_details_version
 from .permissions import (
-    IsOrganizerOrReadOnly, IsInvitedToPrivateEvent,
-    IsOwnerOrReadOnly, CanRSVPToEvent
+    IsOrganizerOrReadOnly, IsOwnerOrReadOnly
 )
 
 
+def make_etag(*parts):
+    """Build a quoted ETag from the given version parts."""
+    digest = hashlib.md5(':'.join(map(str, parts)).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def query_param_is_true(request, name):
+    """
+    Read a boolean query parameter; only the values DRF's BooleanField
+    accepts as true ('1', 'true', 'yes', 'on', ...) count as set.
+    """
+    return request.query_params.get(name) in serializers.BooleanField.TRUE_VALUES
+
+
+# Serialized event detail/RSVP/review payloads are cached under keys that
+# change with the data, so the timeout only bounds memory use
+EVENT_PAYLOAD_CACHE_TIMEOUT = 60 * 60
+
+
 class UserProfileViewSet(viewsets.ModelViewSet):
     """
     ViewSet for UserProfile management.
     Users can only view and update their own profile.
     """
     
-    queryset = UserProfile.objects.select_related('user').all()
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """Filter to show only the current user's profile."""
-        return self.queryset.filter(user=self.request.user)
+        return UserProfile.objects.select_related('user').filter(user=self.request.user)
 
     @action(detail=False, methods=['get', 'put', 'patch'])
     def me(self, request):
@@ -70,30 +97,73 @@ class EventViewSet(viewsets.ModelViewSet):
     """
     
     permission_classes = [IsAuthenticatedOrReadOnly, IsOrganizerOrReadOnly]
+    pagination_class = KnownCountPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['is_public', 'organizer', 'location']
+    filterset_class = EventFilterSet
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['start_time', 'created_at', 'title']
     ordering = ['-start_time']
 
-    def get_queryset(self):
+    def get_visible_events(self):
         """
-        Optimize queries with select_related and prefetch_related.
-        Filter private events based on user access.
+        Events the requesting user may see: public events, plus private
+        events they organize or have RSVP'd to.
         """
-        queryset = Event.objects.select_related('organizer')
-
         # If user is not authenticated, show only public events
         if not self.request.user.is_authenticated:
-            return queryset.filter(is_public=True)
+            return Event.objects.filter(is_public=True)
 
-        # Show public events + private events user is involved with
+        # RSVPs are matched with EXISTS rather than a join so rows
+        # aren't duplicated and no DISTINCT is needed.
         user = self.request.user
-        queryset = queryset.filter(
+        return Event.objects.filter(
             Q(is_public=True) |
             Q(organizer=user) |
-            Q(rsvps__user=user)
-        ).distinct()
+            Q(Exists(RSVP.objects.filter(event_id=OuterRef('pk'), user=user)))
+        )
+
+    def get_queryset(self):
+        """
+        Optimize queries with select_related and prefetch_related.
+        Filter private events based on user access.
+        """
+        queryset = self.get_visible_events()
+
+        if self.action == 'retrieve':
+            # Payload version markers plus the counts and organizer the
+            # payload shows, all from one row; related rows are prefetched
+            # onto it only on a cache miss
+            queryset = (
+                queryset.select_related('organizer')
+                .with_counts()
+                .with_last_modified()
+            )
+            if self.request.user.is_authenticated:
+                # The requesting user's RSVP status, fetched with the event
+                queryset = queryset.annotate(
+                    current_user_rsvp=Subquery(
+                        RSVP.objects.filter(
+                            event=OuterRef('pk'), user=self.request.user
+                        ).values('status')[:1]
+                    )
+                )
+            return queryset
+
+        queryset = queryset.select_related('organizer')
+
+        if self.action in ('list', 'rsvps', 'reviews'):
+            # Only read actions render counts; writes skip the aggregation
+            queryset = queryset.with_counts()
+
+        if self.action == 'list':
+            # Skip description/updated_at which the list serializer never reads
+            queryset = queryset.only(
+                'id', 'title', 'location', 'start_time', 'end_time',
+                'is_public', 'created_at', 'organizer__id', 'organizer__username'
+            )
+        elif self.action in ('rsvps', 'reviews'):
+            # Version markers for the serialized payload cache
+            queryset = queryset.with_last_modified()
 
         return queryset
 
@@ -105,35 +175,90 @@ class EventViewSet(viewsets.ModelViewSet):
             return EventCreateUpdateSerializer
         return EventDetailSerializer
 
+    def get_payload_cache_key(self, prefix, event):
+        """
+        Build a cache key for serialized event data from the
+        with_last_modified() annotations; any change to the event, its
+        RSVPs or its reviews produces a new key. User details are versioned
+        separately, see get_cached_payload().
+        """
+        version = [
+            event.updated_at, event.rsvp_total, event.rsvps_updated_at,
+            event.review_total, event.reviews_updated_at,
+            event.is_upcoming, event.is_ongoing,
+        ]
+        version = [
+            value.timestamp() if hasattr(value, 'timestamp') else value
+            for value in version
+        ]
+        return f"{prefix}:{event.pk}:{':'.join(map(str, version))}"
+
+    def get_cached_payload(self, cache_key):
+        """
+        Fetch a cached payload and the user details marker in one cache
+        round trip. Payloads embed usernames and organizer details, so
+        they're stored with the marker they were built under (see
+        set_cached_payload()) and count as missing once it changes.
+        Returns (data or None, user details version).
+        """
+        cached = cache.get_many([cache_key, USER_DETAILS_VERSION_KEY])
+        user_version = cached.get(USER_DETAILS_VERSION_KEY)
+        if user_version is None:
+            user_version = user_details_version()
+        entry = cached.get(cache_key)
+        if entry is None or entry[0] != user_version:
+            return None, user_version
+        return entry[1], user_version
+
+    def set_cached_payload(self, cache_key, data, user_version):
+        """Cache a payload together with the user details marker it was built under."""
+        cache.set(cache_key, (user_version, data), EVENT_PAYLOAD_CACHE_TIMEOUT)
+
     def retrieve(self, request, *args, **kwargs):
         """
-        Retrieve single event with prefetched related data.
-        Apply private event access permission.
+        Retrieve single event, serving the serialized payload from cache.
+        Responds 304 when the client's If-None-Match matches the ETag.
         """
+        # Private events the user can't access are excluded by
+        # get_queryset, so get_object() already returns 404 for them
         instance = self.get_object()
-        
-        # Check private event access
-        if not instance.is_public:
-            permission = IsInvitedToPrivateEvent()
-            if not permission.has_object_permission(request, self, instance):
-                return Response(
-                    {'detail': 'You do not have access to this private event.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-
-        # Prefetch related data for detail view
-        instance = Event.objects.prefetch_related(
-            Prefetch('rsvps', queryset=RSVP.objects.select_related('user')),
-            Prefetch('reviews', queryset=Review.objects.select_related('user'))
-        ).select_related('organizer').get(pk=instance.pk)
-
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
-
-    @method_decorator(cache_page(60 * 5))  # Cache for 5 minutes
+        current_user_rsvp = getattr(instance, 'current_user_rsvp', None)
+
+        cache_key = self.get_payload_cache_key('event-detail', instance)
+        data, user_version = self.get_cached_payload(cache_key)
+        etag = make_etag(cache_key, user_version, current_user_rsvp)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        if data is None:
+            # Prefetch related data only when the payload must be built
+            prefetch_related_objects([instance], *event_detail_prefetches())
+            data = self.get_serializer(instance).data
+            self.set_cached_payload(cache_key, data, user_version)
+
+        # The cached payload is shared by all users, so the per-user RSVP
+        # status is added afterwards
+        data = {**data, 'current_user_rsvp': current_user_rsvp}
+        return Response(data, headers={'ETag': etag})
+
+    @method_decorator(cache_page_if_anonymous(60 * 5))  # Cache for 5 minutes
     def list(self, request, *args, **kwargs):
-        """Cached list view for public events."""
-        return super().list(request, *args, **kwargs)
+        """
+        List events; cached for anonymous users, who only see public events.
+        The ETag summarizes every matching event, so a 304 is returned
+        without loading or serializing the page when nothing changed.
+        """
+        events = self.filter_queryset(self.get_visible_events())
+        summary = events.change_summary()
+        etag = make_etag(*sorted(summary.items()), user_details_version())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            # The summary already counted the filtered events
+            self.paginator.known_count = summary['event_total']
+            response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        return response
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def rsvp(self, request, pk=None):
@@ -141,27 +266,32 @@ class EventViewSet(viewsets.ModelViewSet):
         RSVP to an event.
         POST /api/events/{id}/rsvp/ with {'status': 'going'|'maybe'|'not_going'}
         """
+        # Private events the user can't RSVP to are excluded by
+        # get_queryset, so get_object() returns 404 for them
         event = self.get_object()
-        
-        # Check if user can RSVP to this event
-        can_rsvp = CanRSVPToEvent()
-        if not can_rsvp.has_object_permission(request, self, event):
+
+        # Validated with a ChoiceField so non-string input (lists, dicts)
+        # is rejected with a 400 like any other invalid choice
+        status_field = serializers.ChoiceField(choices=RSVP.STATUS_CHOICES)
+        try:
+            status_value = status_field.run_validation(
+                request.data.get('status', 'going')
+            )
+        except serializers.ValidationError as exc:
             return Response(
-                {'detail': 'You cannot RSVP to this private event.'},
-                status=status.HTTP_403_FORBIDDEN
+                {'status': exc.detail},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Get or create RSVP
-        rsvp, created = RSVP.objects.get_or_create(
+        # Create or update the RSVP with a single save; a bulk_create
+        # upsert would be one statement but skips the post_save signal
+        # that notifies the organizer and can't tell creates from updates
+        rsvp, created = RSVP.objects.update_or_create(
             event=event,
-            user=request.user
+            user=request.user,
+            defaults={'status': status_value}
         )
 
-        # Update status if provided
-        status_value = request.data.get('status', 'going')
-        rsvp.status = status_value
-        rsvp.save()
-
         serializer = RSVPSerializer(rsvp)
         return Response(
             serializer.data,
@@ -171,13 +301,20 @@ class EventViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def rsvps(self, request, pk=None):
         """
-        List all RSVPs for an event.
+        List RSVPs for an event, newest first, cursor-paginated.
         GET /api/events/{id}/rsvps/
+        GET /api/events/{id}/rsvps/?count_only=1 for counts only
         """
         event = self.get_object()
-        rsvps = event.rsvps.select_related('user').all()
-        serializer = RSVPSerializer(rsvps, many=True)
-        return Response(serializer.data)
+        if query_param_is_true(request, 'count_only'):
+            return Response({
+                'rsvp_count': event.rsvp_total,
+                'attendee_count': event.attendee_count,
+            })
+
+        return self.list_related(
+            request, event, 'event-rsvps', event.rsvps.all(), RSVPListSerializer
+        )
 
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated])
     def review(self, request, pk=None):
@@ -187,37 +324,68 @@ class EventViewSet(viewsets.ModelViewSet):
         """
         event = self.get_object()
 
-        # Check if review already exists
-        existing_review = Review.objects.filter(
-            event=event,
-            user=request.user
-        ).first()
+        data = request.data.copy()
+        data['event'] = event.pk
+        serializer = ReviewSerializer(
+            data=data,
+            context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
 
-        if existing_review:
+        # Rely on the (event, user) unique constraint instead of checking
+        # for an existing review first
+        try:
+            with transaction.atomic():
+                serializer.save(event=event, user=request.user)
+        except IntegrityError:
             return Response(
                 {'detail': 'You have already reviewed this event.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        serializer = ReviewSerializer(
-            data=request.data,
-            context={'request': request}
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save(event=event, user=request.user)
-
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=['get'])
     def reviews(self, request, pk=None):
         """
-        List all reviews for an event.
+        List reviews for an event, newest first, cursor-paginated.
         GET /api/events/{id}/reviews/
+        GET /api/events/{id}/reviews/?count_only=1 for counts only
         """
         event = self.get_object()
-        reviews = event.reviews.select_related('user').all()
-        serializer = ReviewSerializer(reviews, many=True)
-        return Response(serializer.data)
+        if query_param_is_true(request, 'count_only'):
+            average_rating = event.average_rating
+            return Response({
+                'review_count': event.review_count,
+                'average_rating': (
+                    round(average_rating, 2) if average_rating is not None else None
+                ),
+            })
+
+        return self.list_related(
+            request, event, 'event-reviews', event.reviews.all(), ReviewListSerializer
+        )
+
+    def list_related(self, request, event, cache_prefix, queryset, serializer_class):
+        """
+        Return one cursor-paginated page of an event's RSVPs or reviews,
+        caching the serialized page under the event's payload cache key.
+        Rows are fetched as dicts via serializer_class.project().
+        """
+        paginator = NewestFirstCursorPagination()
+        cursor = request.query_params.get(paginator.cursor_query_param, '')
+        cache_key = f"{self.get_payload_cache_key(cache_prefix, event)}:{cursor}"
+        data, user_version = self.get_cached_payload(cache_key)
+        if data is None:
+            # No view is passed so the event list's OrderingFilter
+            # doesn't override the pagination ordering
+            page = paginator.paginate_queryset(
+                serializer_class.project(queryset), request
+            )
+            serializer = serializer_class(page, many=True)
+            data = paginator.get_paginated_response(serializer.data).data
+            self.set_cached_payload(cache_key, data, user_version)
+        return Response(data)
 
 
 class RSVPViewSet(viewsets.ModelViewSet):
@@ -226,20 +394,20 @@ class RSVPViewSet(viewsets.ModelViewSet):
     Users can view all RSVPs but only modify their own.
     """
     
-    queryset = RSVP.objects.select_related('user', 'event').all()
     serializer_class = RSVPSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['event', 'status']
+    filterset_class = RSVPFilterSet
 
     def get_queryset(self):
         """Filter RSVPs for events user has access to."""
         user = self.request.user
-        return self.queryset.filter(
+        # Only forward foreign keys are joined, so rows can't repeat
+        return RSVP.objects.select_related('user', 'event').filter(
             Q(event__is_public=True) |
             Q(event__organizer=user) |
             Q(user=user)
-        ).distinct()
+        )
 
     def perform_create(self, serializer):
         """Set user to current user on creation."""
@@ -252,22 +420,21 @@ class ReviewViewSet(viewsets.ModelViewSet):
     Users can view all reviews but only modify their own.
     """
     
-    queryset = Review.objects.select_related('user', 'event').all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['event', 'rating']
+    filterset_class = ReviewFilterSet
     ordering_fields = ['rating', 'created_at']
     ordering = ['-created_at']
 
     def get_queryset(self):
         """Filter reviews for events user has access to."""
         user = self.request.user
-        return self.queryset.filter(
+        return Review.objects.select_related('user', 'event').filter(
             Q(event__is_public=True) |
             Q(event__organizer=user) |
-            Q(event__rsvps__user=user)
-        ).distinct()
+            Q(Exists(RSVP.objects.filter(event_id=OuterRef('event_id'), user=user)))
+        )
 
     def perform_create(self, serializer):
         """Set user to current user on creation."""